@@ -12,7 +12,6 @@ Funtionalities:
 import os
 import argparse
 import numpy as np
-from angstrom.geometry import Quaternion
 from angstrom.visualize.blender import Blender
 from angstrom import Molecule, Trajectory
 from angstrom.visualize import render
@@ -23,18 +22,24 @@ def rotation(mol, n_frames, rot_angle, rot_axis, interpolation='linear'):
     Rotate molecule around an axis for given number of frames.
     """
     if interpolation == 'linear':
-        angles = np.cumsum(np.full((n_frames,), np.deg2rad(rot_angle / n_frames)))
+        angles = np.arange(1, n_frames + 1, dtype=np.float64) * np.deg2rad(rot_angle / n_frames)
     elif interpolation == 'sine':
-        a = np.deg2rad(rot_angle) / np.pi
-        x = np.arange(-np.pi / 2, np.pi / 2, np.pi / n_frames)
-        angles = a * np.pi / 2 * np.sin(x) + (np.pi / 2) * a
+        half_angle = np.deg2rad(rot_angle) / 2
+        x = np.linspace(-np.pi / 2, np.pi / 2, n_frames, endpoint=False)
+        angles = half_angle * (np.sin(x) + 1.0)
     n_atoms = len(mol.atoms)
-    motion = np.zeros((n_frames + 1, n_atoms, 3))
-    Q = Quaternion([0, 1, 1, 1])
-    for d_angle, frame in zip(angles, range(n_frames)):
-        motion[frame] = np.array([Q.rotation(coor, rot_axis, d_angle).np() for coor in mol.coordinates])
-    traj = Trajectory(atoms=np.tile(mol.atoms, n_frames).reshape((n_frames, n_atoms)),
-                  coordinates=motion)
+    # Unit quaternion (s, qv) for each frame: rotation by angle around the axis (p2 - p1)
+    # Single precision is enough for visualization and halves the size of the motion array
+    axis_point1, axis_point2 = np.array(rot_axis[0], dtype=np.float32), np.array(rot_axis[1], dtype=np.float32)
+    axis = (axis_point2 - axis_point1) / np.linalg.norm(axis_point2 - axis_point1)
+    s = np.cos(angles / 2).astype(np.float32)
+    qv = np.sin(angles / 2).astype(np.float32)[:, None] * axis[None, :]
+    # Rotate all atoms at once using Euler-Rodrigues formula -> v' = v + s * t + qv x t (t = 2 * qv x v)
+    coordinates = np.asarray(mol.coordinates, dtype=np.float32) - axis_point2
+    t = 2 * np.cross(qv[:, None, :], coordinates[None, :, :])
+    motion = coordinates[None] + s[:, None, None] * t + np.cross(qv[:, None, :], t) + axis_point2
+    traj = Trajectory(atoms=np.broadcast_to(mol.atoms, (n_frames, n_atoms)),
+                      coordinates=motion, layout='soa')
     return traj
 
 
@@ -98,6 +103,8 @@ def main():
                         help="Don't render the image (default: False)")
     parser.add_argument('--save', '-s', default='', type=str, metavar='',
                         help="Save .blend file [ex: molecule.blend] (default: don't save)")
+    parser.add_argument('--jobs', '-j', default=1, type=int, metavar='',
+                        help="Number of parallel Blender processes for rendering video frames (default: 1)")
     parser.add_argument('--verbose', '-v', action='store_true', default=False,
                         help="Verbosity  (default: False)")
 
@@ -125,7 +132,7 @@ def main():
             traj = rotation(mol, args.rotate[4], args.rotate[0], rot_axis, interpolation='linear')
         else:
             traj = Trajectory(read=args.molecule)
-        render(traj, os.path.splitext(args.molecule)[0], renderer=blend, verbose=args.verbose)
+        render(traj, os.path.splitext(args.molecule)[0], renderer=blend, verbose=args.verbose, n_jobs=args.jobs)
     else:
         if os.path.splitext(args.molecule)[1] == '.pdb':
             blend.run()
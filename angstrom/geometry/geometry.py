@@ -7,7 +7,7 @@ import numpy as np
 import periodictable
 
 
-def get_molecule_center(atoms, coordinates, mass=True):
+def get_molecule_center(atoms, coordinates, mass=True, masses=None):
     """
     Calculate center of mass or geometric center for given coordinates and atom names of a molecule.
 
@@ -19,6 +19,8 @@ def get_molecule_center(atoms, coordinates, mass=True):
         List of coordinates (2D list).
     mass: bool
         Use atomic masses (True) or calculate geometric center (False).
+    masses: ndarray or None
+        Precomputed atomic masses (optional), looked up from element names if None.
 
     Returns
     -------
@@ -26,9 +28,9 @@ def get_molecule_center(atoms, coordinates, mass=True):
         Center coordinate.
 
     """
-    if mass:
+    if mass and masses is None:
         masses = np.array([periodictable.elements.symbol(atom).mass for atom in atoms])
-    else:
+    elif not mass:
         masses = np.ones(len(atoms))
     total_mass = masses.sum()
     x_cm = (masses * coordinates[:, 0]).sum() / total_mass
@@ -3,6 +3,28 @@
 Quaternion operations for Ångström Python package.
 """
 import numpy as np
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _rotate_point(point, axis_point1, axis_point2, angle):
+    """
+    Rotate a point around an axis using Euler-Rodrigues formula -> v' = v + s * t + q x t (t = 2 * q x v).
+
+    """
+    axis = axis_point2 - axis_point1
+    axis = axis / np.sqrt(axis[0] ** 2 + axis[1] ** 2 + axis[2] ** 2)
+    s = np.cos(angle / 2.0)
+    q = np.sin(angle / 2.0) * axis
+    v = point - axis_point2
+    t = 2.0 * np.cross(q, v)
+    return v + s * t + np.cross(q, t) + axis_point2
+
+
+if njit is not None:
+    _rotate_point = njit(cache=True, fastmath=True)(_rotate_point)
 
 
 class Quaternion(object):
@@ -150,6 +172,11 @@ class Quaternion(object):
 
         """
         axis_point1, axis_point2 = rotation_axis
+        if njit is not None:
+            x, y, z = _rotate_point(np.asarray(rotation_point, dtype=np.float64),
+                                    np.asarray(axis_point1, dtype=np.float64),
+                                    np.asarray(axis_point2, dtype=np.float64), float(rotation_angle))
+            return Quaternion([0, x, y, z])
         i = axis_point2[0] - axis_point1[0]
         j = axis_point2[1] - axis_point1[1]
         k = axis_point2[2] - axis_point1[2]
@@ -54,6 +54,23 @@ class Molecule:
         """
         return "<Molecule object [%s] with: %s atoms>" % (self.name, len(self.atoms))
 
+    @property
+    def atoms(self):
+        """
+        Atom names of the molecule.
+
+        """
+        return self._atoms
+
+    @atoms.setter
+    def atoms(self, atoms):
+        """
+        Set atom names and reset cached atomic masses.
+
+        """
+        self._atoms = atoms
+        self._masses, self._mass_atoms = None, None
+
     def __add__(self, mol):
         """
         Molecule addition for joining the coordinates and elements into a new molecule object.
@@ -226,6 +243,9 @@ class Molecule:
             Molecule center coordinates.
 
         """
+        # Use shared atomic masses only if they were calculated for the current atoms
+        if self._masses is not None and np.array_equal(self.atoms, self._mass_atoms):
+            return get_molecule_center(self.atoms, self.coordinates, mass=mass, masses=self._masses)
         return get_molecule_center(self.atoms, self.coordinates, mass=mass)
 
     def center(self, coor=[0, 0, 0], mass=True):
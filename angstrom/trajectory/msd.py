@@ -0,0 +1,58 @@
+"""
+--- Ångström ---
+Mean squared displacement calculation for trajectories.
+Uses a Numba compiled kernel if Numba is installed.
+"""
+import numpy as np
+try:
+    from numba import njit, prange
+except ImportError:
+    njit, prange = None, range
+
+
+def _msd_kernel(coordinates, reference):
+    """
+    Sum of squared displacements from the reference frame for each frame in a single pass.
+
+    """
+    n_frames, n_values = coordinates.shape
+    msd = np.empty(n_frames)
+    for f in prange(n_frames):
+        acc = 0.0
+        for i in range(n_values):
+            d = coordinates[f, i] - coordinates[reference, i]
+            acc += d * d
+        msd[f] = acc
+    return msd
+
+
+if njit is not None:
+    _msd_kernel = njit(cache=True, fastmath=True, parallel=True)(_msd_kernel)
+
+
+def get_msd(coordinates, reference=0):
+    """
+    Calculate mean squared displacement of atoms for each frame with respect to a reference frame.
+
+    Parameters
+    ----------
+    coordinates : ndarray
+        Atomic coordinates for each frame, either (frames, atoms, 3) or (frames, 3, atoms) shaped.
+    reference : int
+        Index of the reference frame (default: 0).
+
+    Returns
+    -------
+    ndarray
+        Mean squared displacement for each frame.
+
+    """
+    coordinates = np.asarray(coordinates)
+    n_frames, n_values = coordinates.shape[0], int(np.prod(coordinates.shape[1:]))
+    if n_frames == 0 or n_values == 0:
+        return np.zeros(n_frames)
+    n_atoms = n_values / 3
+    coordinates = coordinates.reshape((n_frames, n_values))
+    if njit is not None:
+        return _msd_kernel(coordinates, reference) / n_atoms
+    return np.square(coordinates - coordinates[reference]).sum(axis=1) / n_atoms
@@ -26,13 +26,12 @@ def read_xyz_traj(filename):
         traj = traj_file.readlines()
     n_atoms = int(traj[0].strip())                # Get number of atoms from first line
     n_frames = int(len(traj) / (n_atoms + 2))     # Calculate number of frames (assuming n_atoms is constant)
-    trajectory = {'atoms': np.empty((n_frames, n_atoms), dtype='U2'),  # String of length 2
-                  'coordinates': np.empty((n_frames, n_atoms, 3)),     # Float
-                  'headers': np.empty((n_frames,), dtype=object)}      # Python object
-    for frame in range(n_frames):
-        start = frame * (n_atoms + 2)             # Frame start
-        end = (frame + 1) * (n_atoms + 2)         # Frame end
-        trajectory['coordinates'][frame] = [[float(i) for i in line.split()[1:4]] for line in traj[start + 2:end]]
-        trajectory['atoms'][frame] = [line.split()[0] for line in traj[start + 2:end]]
-        trajectory['headers'][frame] = (traj[start + 1].strip())
+    frames = np.array(traj[:n_frames * (n_atoms + 2)], dtype=object).reshape((n_frames, n_atoms + 2))
+    # Parse all atom lines at once -> (atom, x, y, z) for each line
+    xyz_dtype = [('atom', 'U2'), ('x', np.float64), ('y', np.float64), ('z', np.float64)]
+    xyz = np.loadtxt(frames[:, 2:].ravel(), dtype=xyz_dtype, usecols=(0, 1, 2, 3), comments=None, ndmin=1)
+    trajectory = {'atoms': xyz['atom'].reshape((n_frames, n_atoms)),                                 # String of length 2
+                  'coordinates': np.stack((xyz['x'], xyz['y'], xyz['z']), axis=-1).reshape((n_frames, n_atoms, 3)),
+                  'headers': np.empty((n_frames,), dtype=object)}                                   # Python object
+    trajectory['headers'][:] = [header.strip() for header in frames[:, 1]]
     return trajectory
@@ -4,9 +4,11 @@ Read, manipulate and analyze molecular trajectory files.
 """
 from .read import read_xyz_traj
 from .write import write_xyz_traj
+from .msd import get_msd
 from angstrom.geometry import get_molecule_center
 from angstrom import Molecule
 import numpy as np
+import periodictable
 import os
 
 
@@ -15,7 +17,7 @@ class Trajectory:
     Reading and analyzing trajectories in xyz format.
 
     """
-    def __init__(self, atoms=None, coordinates=None, read=None, molecule=None):
+    def __init__(self, atoms=None, coordinates=None, read=None, molecule=None, layout='aos'):
         """
         Create a trajectory object.
 
@@ -29,9 +31,18 @@ class Trajectory:
             File name to read molecule file (formats: xyz).
         molecule : Molecule
             Create a Trajectory with 1 frame from a Molecule object.
+        layout : str
+            Memory layout for storing coordinates ([aos] | soa).
+                - aos: Float64 array with shape (frames, atoms, 3).
+                - soa: Contiguous float32 array with shape (frames, 3, atoms).
+                  Faster per-axis access and half the memory, with single precision coordinates.
+            The 'coordinates' attribute has (frames, atoms, 3) shape for both layouts.
 
         """
+        if layout not in ('aos', 'soa'):
+            raise ValueError("Unknown layout '%s' (options: 'aos' | 'soa')" % layout)
         self.name = 'Trajectory'
+        self.layout = layout
         if atoms is not None and coordinates is not None:
             self.atoms = atoms
             self.coordinates = coordinates
@@ -75,16 +86,25 @@ class Trajectory:
             Joined Trajectory object.
 
         """
-        new_traj = Trajectory(atoms=np.append(self.atoms, traj.atoms, axis=0),
-                              coordinates=np.append(self.coordinates, traj.coordinates, axis=0))
+        n_frames = len(self) + len(traj)
+        coordinates = self._frames(np.empty((n_frames,) + self._coordinates.shape[1:], dtype=self._coordinates.dtype))
+        coordinates[:len(self)] = self.coordinates
+        coordinates[len(self):] = traj.coordinates
+        new_traj = Trajectory(atoms=np.concatenate((self.atoms, traj.atoms), axis=0),
+                              coordinates=coordinates, layout=self.layout)
         return new_traj
 
     def __getitem__(self, i):
         """
         Indexing method. Returns a Molecule object for given index (frame).
+        Atoms and coordinates of the Molecule are views of the trajectory arrays (no copy)
+        and atomic masses cached by 'get_center' are shared with the Molecule if they match the frame atoms.
 
         """
-        return Molecule(atoms=self.atoms[i], coordinates=self.coordinates[i])
+        molecule = Molecule(atoms=self.atoms[i], coordinates=self.coordinates[i])
+        if self._masses is not None and np.array_equal(molecule.atoms, self._mass_atoms):
+            molecule._masses, molecule._mass_atoms = self._masses, self._mass_atoms
+        return molecule
 
     def __iter__(self):
         """
@@ -106,6 +126,55 @@ class Trajectory:
         self.current_frame += 1
         return next_mol
 
+    @property
+    def atoms(self):
+        """
+        Atom names for each frame with (frames, atoms) shape.
+
+        """
+        return self._atoms
+
+    @atoms.setter
+    def atoms(self, atoms):
+        """
+        Set atom names and reset cached atomic masses.
+
+        """
+        self._atoms = atoms
+        self._masses, self._mass_atoms = None, None
+
+    @property
+    def coordinates(self):
+        """
+        Atomic coordinates for each frame with (frames, atoms, 3) shape.
+        For 'soa' layout this is a transposed view of the stored coordinates (no copy).
+
+        """
+        return self._frames(self._coordinates)
+
+    @coordinates.setter
+    def coordinates(self, coordinates):
+        """
+        Store atomic coordinates with (frames, atoms, 3) shape in trajectory memory layout.
+
+        """
+        coordinates = np.asarray(coordinates)
+        if coordinates.size == 0:
+            coordinates = np.empty((0, 0, 3))
+        if self.layout == 'soa':
+            self._coordinates = np.ascontiguousarray(coordinates.transpose(0, 2, 1), dtype=np.float32)
+        else:
+            self._coordinates = np.asarray(coordinates, dtype=np.float64)
+
+    def _frames(self, coordinates):
+        """
+        Returns (frames, atoms, 3) view of coordinates stored in trajectory memory layout.
+
+        """
+        if self.layout == 'soa':
+            return coordinates.transpose(0, 2, 1)
+        return coordinates
+
     def read(self, filename):
         """
         Read xyz formatted trajectory file.
@@ -161,7 +230,45 @@ class Trajectory:
             Molecule center coordinates for each frame.
 
         """
-        centers = np.empty((len(self.atoms), 3))
-        for f, (frame_atoms, frame_coors) in enumerate(zip(self.atoms, self.coordinates)):
-            centers[f] = get_molecule_center(frame_atoms, frame_coors, mass=mass)
-        return centers
+        masses = self._get_masses() if mass else None
+        if mass and masses is None:
+            # Atoms change between frames, calculate the center for each frame separately
+            centers = np.empty((len(self.atoms), 3))
+            for f, (frame_atoms, frame_coors) in enumerate(zip(self.atoms, self.coordinates)):
+                centers[f] = get_molecule_center(frame_atoms, frame_coors, mass=mass)
+            return centers
+        weights = masses if mass else np.ones(self.coordinates.shape[1])
+        subscripts = 'fjn,n->fj' if self.layout == 'soa' else 'fnj,n->fj'
+        return np.einsum(subscripts, self._coordinates, weights / weights.sum())
+
+    def get_msd(self, reference=0):
+        """
+        Get mean squared displacement of atoms at each frame.
+
+        Parameters
+        ----------
+        reference : int
+            Index of the reference frame (default: 0).
+
+        Returns
+        -------
+        ndarray
+            Mean squared displacement for each frame.
+
+        """
+        return get_msd(self._coordinates, reference=reference)
+
+    def _get_masses(self):
+        """
+        Returns atomic masses if the atoms are the same for all frames, otherwise None.
+        Masses are cached together with the atom names they were calculated for and
+        recalculated if the atoms change (either reassigned or modified in place).
+
+        """
+        atoms = np.asarray(self.atoms)
+        if len(atoms) == 0 or not np.all(atoms == atoms[0]):
+            return None
+        if self._masses is None or not np.array_equal(atoms[0], self._mass_atoms):
+            self._masses = np.array([periodictable.elements.symbol(atom).mass for atom in atoms[0]])
+            self._mass_atoms = atoms[0].copy()
+        return self._masses
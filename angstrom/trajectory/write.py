@@ -2,6 +2,7 @@
 --- Ångström ---
 Functions for writing Trajectory files.
 """
+import numpy as np
 
 
 def write_xyz_traj(fileobj, atoms, coordinates, headers=None):
@@ -30,8 +31,9 @@ def write_xyz_traj(fileobj, atoms, coordinates, headers=None):
         headers = ['angstrom - %i' % i for i in range(n_frames)]
     xyz_format = '%-2s %7.4f %7.4f %7.4f\n'
     for frame_atoms, frame_coors, frame_header in zip(atoms, coordinates, headers):
-        fileobj.write('%i\n' % len(frame_atoms))
-        fileobj.write('%s\n' % frame_header)
-        for atom, coor in zip(frame_atoms, frame_coors):
-            fileobj.write(xyz_format % (atom, coor[0], coor[1], coor[2]))
+        # Format the whole frame at once -> atom lines are interleaved as (atom, x, y, z) values
+        n_atoms = len(frame_atoms)
+        frame = np.empty((n_atoms, 4), dtype=object)
+        frame[:, 0], frame[:, 1:] = frame_atoms, frame_coors
+        fileobj.write('%i\n%s\n' % (n_atoms, frame_header) + xyz_format * n_atoms % tuple(frame.ravel()))
         fileobj.flush()
@@ -6,8 +6,13 @@ Molecular visualization models for Blender.
 import os
 import yaml
 import pickle
+import tempfile
 import subprocess
 from pprint import pprint
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
 
 
 IMG_SCRIPT = os.path.join(os.path.abspath(os.path.dirname(__file__)), 'blender_image.py')
@@ -70,8 +75,19 @@ COLORS = {'Carbon': (0.05, 0.05, 0.05),
 
 SCRIPTS = {'img': IMG_SCRIPT, 'seq': SEQ_SCRIPT}
 
+# Memory-backed directory for temporary config files (system default if not available)
+TEMP_DIR = '/dev/shm' if os.path.isdir('/dev/shm') else None
+
 PI = 3.14159265359
 
+# Camera (location, rotation) for each view plane with unit distance from origin
+VIEW_TEMPLATES = {'xy': ([0, 0, 1], [0, 0, 0]),
+                  'xz': ([0, -1, 0], [PI / 2, 0, 0]),
+                  'yx': ([0, 0, -1], [0, PI, -PI / 2]),
+                  'yz': ([1, 0, 0], [PI / 2, 0, PI / 2]),
+                  'zx': ([0, 1, 0], [PI / 2, -PI / 2, PI]),
+                  'zy': ([-1, 0, 0], [PI / 2, -PI / 2, -PI / 2])}
+
 
 class Blender:
     """
@@ -94,7 +110,7 @@ class Blender:
                   model='default', colors=COLORS, background_color=None,
                   resolution=(1920, 1080), brightness=1.0, lamp=2.0,
                   camera_zoom=20, camera_distance=10, camera_view='xy', camera_type='ORTHO',
-                  verbose=False, pickle='temp-config.pkl', executable='blender'):
+                  verbose=False, pickle=None, executable='blender'):
         """
         Get Blender image rendering settings.
 
@@ -144,8 +160,9 @@ class Blender:
             Camera type (ORTHO | PERSP).
         verbose : bool
             Blender subprocess verbosity.
-        pickle : str
+        pickle : str or None
             Pickle file for communicating settings with Blender.
+            None creates a temporary file (in /dev/shm if available) for each run.
         executable : str
             Path to blender executable (depends on OS).
 
@@ -155,19 +172,12 @@ class Blender:
             Blender render settings.
 
         """
-        d = camera_distance
-        VIEW = {'xy': dict(location=[0, 0, d], rotation=[0, 0, 0]),
-                'xz': dict(location=[0, -d, 0], rotation=[PI / 2, 0, 0]),
-                'yx': dict(location=[0, 0, -d], rotation=[0, PI, -PI / 2]),
-                'yz': dict(location=[d, 0, 0], rotation=[PI / 2, 0, PI / 2]),
-                'zx': dict(location=[0, d, 0], rotation=[PI / 2, -PI / 2, PI]),
-                'zy': dict(location=[-d, 0, 0], rotation=[PI / 2, -PI / 2, -PI / 2])}
-
-        config = {'pdb': {**{'filepath': mol_file}, **self.models[model]},
+        location, rotation = VIEW_TEMPLATES[camera_view]
+        config = {'pdb': dict(self.models[model], filepath=mol_file),
                   'img_file': img_file, 'img_format': img_format,
                   'vid_file': vid_file, 'vid_format': vid_format, 'images': images, 'fps': fps,
-                  'camera': dict(location=VIEW[camera_view]['location'],
-                                 rotation=VIEW[camera_view]['rotation'],
+                  'camera': dict(location=[i * camera_distance for i in location],
+                                 rotation=list(rotation),
                                  type=camera_type, zoom=camera_zoom),
                   'brightness': brightness, 'lamp': lamp, 'resolution': resolution,
                   'colors': colors, 'background_color': background_color,
@@ -191,7 +201,8 @@ class Blender:
             Writes pickle config file.
         """
         with open(config_file, 'wb') as handle:
-            pickle.dump(self.config, handle, protocol=pickle.HIGHEST_PROTOCOL)
+            # Protocol 4 can be read by the Python bundled with Blender 2.7x (3.5+)
+            pickle.dump(self.config, handle, protocol=4)
 
 
     def read_config(self, config_file):
@@ -215,7 +226,7 @@ class Blender:
         user can simply write 'img' or 'vid' to select image or video rendering.
         """
         with open(config_file, 'r') as f:
-            self.config = yaml.load(f)
+            self.config = yaml.load(f, Loader=_Loader)
         self.config['script'] = SCRIPTS[self.config['script']]
 
     def print_config(self):
@@ -247,12 +258,16 @@ class Blender:
         None
             Runs Blender Python script.
         """
-        self.write_config(self.config['pickle'])
-        command = [self.config['executable'], '--background', '--python', self.config['script'], '--', self.config['pickle']]
-        with open(os.devnull, 'w') as null:
-            blend = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            stdout, stderr = blend.stdout.decode(), blend.stderr.decode()
-            if self.config['verbose']:
-                print("Stdout:\n\n%s\nStderr:\n%s" % (stdout, stderr))
-        if os.path.exists(self.config['pickle']):
-            os.remove(self.config['pickle'])
+        config_file = self.config['pickle']
+        if config_file is None:
+            handle, config_file = tempfile.mkstemp(suffix='.pkl', dir=TEMP_DIR)
+            os.close(handle)
+        try:
+            self.write_config(config_file)
+            command = [self.config['executable'], '--background', '--python', self.config['script'], '--', config_file]
+            # Stream Blender output to the console if verbose, otherwise discard it without buffering
+            output = None if self.config['verbose'] else subprocess.DEVNULL
+            subprocess.run(command, stdout=output, stderr=output)
+        finally:
+            if os.path.exists(config_file):
+                os.remove(config_file)
@@ -80,9 +80,46 @@ def render_pdb(settings):
         bpy.ops.render.render(write_still=True)
 
 
+def render_frames(settings):
+    """
+    Render a sequence of pdb files in a single Blender session.
+
+    Parameters
+    ----------
+    settings : dict
+        Blender render settings.
+            - frames : list
+                List of (pdb file, image file) pairs for each frame.
+
+    Returns
+    -------
+    None
+        This function is called by the Blender Python installation.
+
+    """
+    for pdb_file, img_file in settings['frames']:
+        scene_objects = set(bpy.data.objects.keys())
+        # Data blocks created by the pdb importer (materials last, they are used by the others)
+        data_blocks = [bpy.data.meshes, bpy.data.curves, bpy.data.metaballs, bpy.data.materials]
+        scene_data = [set(blocks.keys()) for blocks in data_blocks]
+        render_pdb(dict(settings, pdb=dict(settings['pdb'], filepath=pdb_file), img_file=img_file))
+        # Delete the imported molecule before importing the next frame
+        for obj in bpy.data.objects:
+            obj.select = obj.name not in scene_objects
+        bpy.ops.object.delete(use_global=False)
+        # Remove imported meshes and materials so that the next import reuses the element names
+        # (ex: 'Carbon' instead of 'Carbon.001') and atom colors are applied to the right materials
+        for blocks, names in zip(data_blocks, scene_data):
+            for block in [block for block in blocks if block.name not in names]:
+                blocks.remove(block)
+
+
 if __name__ == '__main__':
     argv = sys.argv[sys.argv.index("--") + 1:]  # get all args after "--"
     with open(argv[0], 'rb') as handle:
         settings = pickle.load(handle)
     print(settings)
-    render_pdb(settings)
+    if settings.get('frames'):
+        render_frames(settings)
+    else:
+        render_pdb(settings)
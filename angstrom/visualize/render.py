@@ -6,13 +6,15 @@ from .blender import Blender
 from .openbabel import OpenBabel
 from angstrom.molecule.write import write_pdb
 from angstrom import Molecule, Trajectory
+from concurrent.futures import ThreadPoolExecutor
 import subprocess
+import copy
 import tempfile
 import pickle
 import os
 
 
-def render(render_obj, output='angstrom', renderer='blender', verbose=False):
+def render(render_obj, output='angstrom', renderer='blender', verbose=False, n_jobs=1):
     """
     Render Molecule object.
 
@@ -29,6 +31,8 @@ def render(render_obj, output='angstrom', renderer='blender', verbose=False):
         and used here as an argument.
     verbose : bool
         Verbosity.
+    n_jobs : int
+        Number of parallel Blender processes for rendering video frames (default: 1).
 
     Returns
     -------
@@ -51,7 +55,7 @@ def render(render_obj, output='angstrom', renderer='blender', verbose=False):
     if isinstance(render_obj, Molecule):
         render_image(render_obj, output, renderer=renderer, verbose=verbose)
     elif isinstance(render_obj, Trajectory):
-        render_video(render_obj, output, renderer=renderer, verbose=verbose)
+        render_video(render_obj, output, renderer=renderer, verbose=verbose, n_jobs=n_jobs)
 
 
 
@@ -100,7 +104,7 @@ def render_image(molecule, img_file, renderer, verbose=False):
     temp_pdb_file.close()
 
 
-def render_video(trajectory, vid_file, renderer, verbose=False):
+def render_video(trajectory, vid_file, renderer, verbose=False, n_jobs=1):
     """
     Renders video of a Trajectory object.
 
@@ -114,6 +118,9 @@ def render_video(trajectory, vid_file, renderer, verbose=False):
         Renderer object (blender).
     verbose : bool
         Verbosity.
+    n_jobs : int
+        Number of parallel Blender processes for rendering frames (default: 1).
+        Frames are split into n_jobs chunks and each chunk is rendered by a separate Blender process.
 
     Returns
     -------
@@ -128,11 +135,26 @@ def render_video(trajectory, vid_file, renderer, verbose=False):
     if renderer.__class__.__name__ == 'Blender':
         vid_dir = os.path.dirname(vid_file)
         print('Rendering %i images with Blender -> %s' % (len(trajectory), vid_dir))
-        images = []
-        for idx, mol in enumerate(trajectory):
-            img_file = os.path.join(vid_dir, '%i.png' % idx)
-            render_image(mol, img_file, renderer)
-            images.append(img_file)
+        # Write pdb file for each frame and render all images in n_jobs Blender runs
+        with tempfile.TemporaryDirectory() as pdb_dir:
+            frames = []
+            for idx, mol in enumerate(trajectory):
+                if not hasattr(mol, 'bonds'):
+                    mol.get_bonds()
+                pdb_file = os.path.join(pdb_dir, '%i.pdb' % idx)
+                with open(pdb_file, 'w') as pdb_fileobj:
+                    write_pdb(pdb_fileobj, mol.atoms, mol.coordinates, bonds=mol.bonds)
+                frames.append((pdb_file, os.path.join(vid_dir, '%i.png' % idx)))
+            renderer.config['verbose'] = verbose
+            if n_jobs > 1:
+                chunk_size = max(1, -(-len(frames) // n_jobs))
+                chunks = [frames[i:i + chunk_size] for i in range(0, len(frames), chunk_size)]
+                # Each Blender process gets its own temporary config file
+                with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+                    list(executor.map(render_frames, [renderer] * len(chunks), chunks, [None] * len(chunks)))
+            else:
+                render_frames(renderer, frames, renderer.config['pickle'])
+        images = [img_file for pdb_file, img_file in frames]
         renderer.configure(images=images, vid_file=vid_file, script='seq', verbose=verbose,
                            executable=renderer.config['executable'], background_color=(1, 1, 1))
         print('Rendering %s video with Blender -> %s' % (trajectory.name, vid_file))
@@ -142,3 +164,27 @@ def render_video(trajectory, vid_file, renderer, verbose=False):
             if os.path.exists(img):
                 os.remove(img)
         renderer.configure()
+
+
+def render_frames(renderer, frames, config_file):
+    """
+    Renders images for a list of frames in a single Blender process.
+
+    Parameters
+    ----------
+    renderer : Blender
+        Blender renderer object (not modified).
+    frames : list
+        List of (pdb file, image file) pairs for each frame.
+    config_file : str or None
+        Pickle file name for communicating settings with Blender (None for a temporary file).
+
+    Returns
+    -------
+    None
+        Saves image files.
+
+    """
+    blender = copy.deepcopy(renderer)
+    blender.config.update(frames=frames, pickle=config_file)
+    blender.run()
@@ -29,7 +29,8 @@ setup(
             'pytest-pep8',
             'tox',
         ],
-        'notebook-vis': ['nglview']
+        'notebook-vis': ['nglview'],
+        'fast': ['numba']
     },
     tests_require=[
         'pytest',
@@ -18,3 +18,17 @@ def test_single_point_90_degrees_rotation():
     # Rotate (0, 0, 1) around y-axis first counter-clockwise then clockwise
     assert np.allclose(Q.rotation([0, 0, 1], ([0, 0, 0], [0, 1, 0]), np.pi / 2).xyz(), [1, 0, 0])
     assert np.allclose(Q.rotation([0, 0, 1], ([0, 0, 0], [0, 1, 0]), -np.pi / 2).xyz(), [-1, 0, 0])
+
+
+def test_rotate_point_kernel_matches_quaternion_product():
+    """Tests Euler-Rodrigues rotation kernel against quaternion product rotation (q * p * q^-1)."""
+    from angstrom.geometry.quaternion import _rotate_point
+    rotate_point = getattr(_rotate_point, 'py_func', _rotate_point)  # Python function if compiled with Numba
+    np.random.seed(0)
+    for point, p1, p2, angle in zip(np.random.rand(10, 3) * 10, np.random.rand(10, 3), np.random.rand(10, 3) * 5,
+                                    np.random.rand(10) * 2 * np.pi):
+        axis = (p2 - p1) / np.linalg.norm(p2 - p1)
+        Q_rot = Quaternion([np.cos(angle / 2)] + list(np.sin(angle / 2) * axis))
+        Q_point = Quaternion([0] + list(point - p2))
+        ref = (Q_rot * Q_point * Q_rot.inv()).np() + p2
+        assert np.allclose(rotate_point(point, p1, p2, angle), ref)
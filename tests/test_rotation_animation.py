@@ -0,0 +1,26 @@
+"""
+--- Ångström ---
+Tests creating rotation animation Trajectory from a Molecule.
+"""
+from angstrom import Molecule
+import numpy as np
+import pytest
+import os
+
+benzene_xyz = os.path.join(os.path.abspath(os.path.dirname(__file__)), 'benzene.xyz')
+
+
+def test_rotation_animation_frames():
+    """Tests rotation animation has one frame per rotation step and matches Molecule rotation."""
+    rotation = pytest.importorskip('angstrom.cli.angstrom_vid').rotation
+    benzene = Molecule(read=benzene_xyz)
+    axis = ([0, 0, 0], [0, 0, 1])
+    for interpolation in ['sine', 'linear']:
+        traj = rotation(benzene, 12, 360, axis, interpolation=interpolation)
+        assert len(traj) == 12
+        assert np.shape(traj.atoms) == (12, 12)
+        assert np.shape(traj.coordinates) == (12, 12, 3)
+    # Last frame of a full linear rotation is the initial structure
+    assert np.allclose(traj.coordinates[-1], benzene.coordinates, atol=1e-4)
+    benzene.rotate(axis, np.pi / 6)
+    assert np.allclose(traj.coordinates[0], benzene.coordinates, atol=1e-4)
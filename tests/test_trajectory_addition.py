@@ -0,0 +1,24 @@
+"""
+--- Ångström ---
+Tests trajectory addition.
+"""
+from angstrom import Trajectory
+import numpy as np
+import os
+
+benzene_traj_x = os.path.join(os.path.abspath(os.path.dirname(__file__)), 'benzene-traj-x.xyz')
+
+
+def test_benzene_trajectory_addition():
+    """Tests joining two benzene trajectories"""
+    benzene = Trajectory(read=benzene_traj_x, layout='soa')
+    benzene_aos = Trajectory(read=benzene_traj_x)
+    for benzene2 in [benzene + benzene_aos, benzene_aos + benzene]:
+        assert len(benzene2) == 2 * len(benzene)
+        assert np.shape(benzene2.coordinates) == (100, 12, 3)
+        assert np.shape(benzene2.atoms) == (100, 12)
+        assert np.allclose(benzene2.coordinates[:50], benzene.coordinates)
+        assert np.allclose(benzene2.coordinates[50:], benzene.coordinates)
+        assert np.array_equal(benzene2.atoms[50:], benzene.atoms)
+    assert (benzene + benzene_aos).layout == 'soa'
+    assert (benzene_aos + benzene).layout == 'aos'
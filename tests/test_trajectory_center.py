@@ -21,3 +21,41 @@ def test_trajectory_center_of_benzene_moving_linearly_in_x():
     assert np.allclose(benzene_coms[0], [3, 3, 3])
     assert np.allclose(benzene_coms, benzene_coms_ref)
     assert np.allclose(benzene_cogs, benzene_coms_ref)
+
+
+def test_trajectory_center_with_different_atoms_in_each_frame():
+    """Tests molecular center calculation for a trajectory with changing atoms between frames"""
+    coordinates = np.array([[[0, 0, 0], [2, 0, 0]], [[0, 0, 0], [2, 0, 0]]])
+    traj = Trajectory(atoms=np.array([['H', 'H'], ['H', 'O']]), coordinates=coordinates)
+    traj_coms = traj.get_center()
+    assert np.allclose(traj_coms[0], [1, 0, 0])
+    assert np.allclose(traj_coms[1], get_molecule_center(['H', 'O'], coordinates[1]))
+    assert traj_coms[1][0] > 1.5
+
+
+def test_trajectory_center_after_changing_atoms():
+    """Tests cached atomic masses are not used after the atoms are changed"""
+    coordinates = np.array([[[0, 0, 0], [2, 0, 0]]])
+    traj = Trajectory(atoms=np.array([['H', 'H']]), coordinates=coordinates)
+    assert np.allclose(traj.get_center(), [[1, 0, 0]])
+    traj.atoms = np.array([['H', 'O']])
+    assert np.allclose(traj.get_center(), [get_molecule_center(['H', 'O'], coordinates[0])])
+
+
+def test_trajectory_with_unknown_elements():
+    """Tests a trajectory with atom names that have no atomic mass can be created and used"""
+    coordinates = np.array([[[0, 0, 0], [2, 0, 0]]])
+    traj = Trajectory(atoms=np.array([['X', 'C1']]), coordinates=coordinates)
+    assert len(traj) == 1
+    assert np.allclose(traj.get_center(mass=False), [[1, 0, 0]])
+
+
+def test_trajectory_center_after_changing_atoms_in_place():
+    """Tests cached atomic masses are not used after the atoms are modified in place"""
+    coordinates = np.array([[[0, 0, 0], [2, 0, 0]]] * 2)
+    traj = Trajectory(atoms=np.array([['H', 'H']] * 2), coordinates=coordinates)
+    assert np.allclose(traj.get_center(), [[1, 0, 0]] * 2)
+    traj.atoms[:, 1] = 'O'
+    assert np.allclose(traj.get_center(), [get_molecule_center(['H', 'O'], coordinates[0])] * 2)
+    traj.atoms[0, 1] = 'H'
+    assert np.allclose(traj.get_center()[0], [1, 0, 0])
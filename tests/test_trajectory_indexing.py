@@ -3,6 +3,7 @@
 Tests indexing a Trajectory.
 """
 from angstrom import Trajectory, Molecule
+from angstrom.geometry import get_molecule_center
 import numpy as np
 import os
 
@@ -14,7 +15,10 @@ def test_trajectory_indexing_atoms_and_coordinates():
     benzene_traj = Trajectory(read=benzene_traj_x)
 
     for frame_idx, benzene_frame in enumerate(benzene_traj):
-        assert np.allclose(benzene_traj[frame_idx].coordinates, benzene_traj.coordinates[frame_idx])
+        assert np.array_equal(benzene_traj[frame_idx].coordinates, benzene_traj.coordinates[frame_idx])
+        # Indexing returns views of the trajectory arrays (no copy)
+        assert np.shares_memory(benzene_traj[frame_idx].coordinates, benzene_traj.coordinates)
+        assert np.shares_memory(benzene_traj[frame_idx].atoms, benzene_traj.atoms)
         for atom, ref_atom in zip(benzene_traj[frame_idx].atoms, benzene_traj.atoms[frame_idx]):
             assert atom == ref_atom
         assert isinstance(benzene_traj[frame_idx], Molecule)
@@ -28,3 +32,46 @@ def test_trajectory_indexing_center_of_mass():
     benzene_coms = benzene_traj.get_center()
     for frame_idx, benzene_frame in enumerate(benzene_traj):
         assert np.allclose(benzene_traj[frame_idx].get_center(), benzene_coms[frame_idx])
+
+
+def test_trajectory_indexing_shares_atomic_masses():
+    """Tests Molecule objects from Trajectory indexing share the cached atomic masses of the Trajectory."""
+    benzene_traj = Trajectory(read=benzene_traj_x)
+    benzene_traj.get_center()
+    assert benzene_traj._masses is not None
+    for benzene_frame in benzene_traj:
+        assert benzene_frame._masses is benzene_traj._masses
+    benzene_frame.delete([0])
+    assert benzene_frame._masses is None
+    assert np.allclose(benzene_frame.get_center(mass=True),
+                       get_molecule_center(benzene_frame.atoms, benzene_frame.coordinates))
+
+
+def test_trajectory_indexing_changing_frame_atoms():
+    """Tests changing atoms of an indexed frame does not use the cached atomic masses of the Trajectory."""
+    benzene_traj = Trajectory(read=benzene_traj_x)
+    benzene_traj.get_center()
+    benzene_frame = benzene_traj[0]
+    benzene_com = benzene_frame.get_center()
+    benzene_frame.atoms = np.array(['O'] + list(benzene_frame.atoms[1:]))
+    assert benzene_frame._masses is None
+    assert np.allclose(benzene_frame.get_center(),
+                       get_molecule_center(benzene_frame.atoms, benzene_frame.coordinates))
+    assert not np.allclose(benzene_frame.get_center(), benzene_com)
+    assert benzene_traj._masses is not None
+
+
+def test_trajectory_indexing_changing_frame_atoms_in_place():
+    """Tests modifying atoms of an indexed frame in place does not use stale cached atomic masses."""
+    benzene_traj = Trajectory(read=benzene_traj_x)
+    benzene_coms = benzene_traj.get_center()
+    benzene_frame = benzene_traj[0]
+    benzene_frame.atoms[1] = 'O'  # Frame atoms are a view -> modifies the Trajectory atoms too
+    assert benzene_traj.atoms[0][1] == 'O'
+    assert np.allclose(benzene_frame.get_center(),
+                       get_molecule_center(benzene_frame.atoms, benzene_frame.coordinates))
+    assert not np.allclose(benzene_frame.get_center(), benzene_coms[0])
+    # Frame from the modified Trajectory does not get masses for the old atoms
+    assert benzene_traj[0]._masses is None
+    assert np.allclose(benzene_traj[0].get_center(), benzene_frame.get_center())
+    assert np.allclose(benzene_traj[1].get_center(), benzene_coms[1])
@@ -14,7 +14,7 @@ def test_trajectory_iteration_atoms_and_coordinates():
     benzene_traj = Trajectory(read=benzene_traj_x)
 
     for frame_idx, benzene_frame in enumerate(benzene_traj):
-        assert np.allclose(benzene_frame.coordinates, benzene_traj.coordinates[frame_idx])
+        assert np.array_equal(benzene_frame.coordinates, benzene_traj.coordinates[frame_idx])
         for atom, ref_atom in zip(benzene_frame.atoms, benzene_traj.atoms[frame_idx]):
             assert atom == ref_atom
         assert isinstance(benzene_frame, Molecule)
@@ -0,0 +1,39 @@
+"""
+--- Ångström ---
+Tests Trajectory coordinate memory layouts.
+"""
+from angstrom import Trajectory
+import numpy as np
+import pytest
+import os
+
+benzene_traj_x = os.path.join(os.path.abspath(os.path.dirname(__file__)), 'benzene-traj-x.xyz')
+
+
+def test_trajectory_soa_and_aos_layouts():
+    """Tests coordinates and centers are the same for 'soa' and 'aos' memory layouts."""
+    soa_traj = Trajectory(read=benzene_traj_x, layout='soa')
+    aos_traj = Trajectory(read=benzene_traj_x)
+    assert aos_traj.layout == 'aos'
+    assert soa_traj._coordinates.shape == (50, 3, 12)
+    assert soa_traj._coordinates.flags['C_CONTIGUOUS']
+    assert soa_traj._coordinates.dtype == np.float32
+    assert aos_traj._coordinates.shape == (50, 12, 3)
+    assert aos_traj._coordinates.dtype == np.float64
+    assert np.shape(soa_traj.coordinates) == np.shape(aos_traj.coordinates) == (50, 12, 3)
+    assert np.allclose(soa_traj.coordinates, aos_traj.coordinates)
+    assert np.allclose(soa_traj.get_center(), aos_traj.get_center())
+    assert np.allclose(soa_traj.get_center(mass=False), aos_traj.get_center(mass=False))
+
+
+def test_trajectory_default_layout_keeps_double_precision():
+    """Tests default layout stores coordinates without loss of precision."""
+    coordinates = np.array([[[1234.5678, 1.0001, 0.0]]])
+    traj = Trajectory(atoms=np.array([['C']]), coordinates=coordinates)
+    assert np.array_equal(traj.coordinates, coordinates)
+
+
+def test_trajectory_unknown_layout():
+    """Tests unknown layout raises an error."""
+    with pytest.raises(ValueError):
+        Trajectory(layout='xyz')
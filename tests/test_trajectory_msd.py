@@ -0,0 +1,51 @@
+"""
+--- Ångström ---
+Tests mean squared displacement calculation for a trajectory.
+"""
+from angstrom import Trajectory
+from angstrom.trajectory.msd import get_msd
+import numpy as np
+import pytest
+import os
+
+benzene_traj_x = os.path.join(os.path.abspath(os.path.dirname(__file__)), 'benzene-traj-x.xyz')
+
+
+def test_trajectory_msd_of_benzene_moving_linearly_in_x():
+    """Tests mean squared displacement for benzene moving 1 Å per frame in +x direction"""
+    benzene = Trajectory(read=benzene_traj_x)
+    msd_ref = np.arange(len(benzene)) ** 2
+    assert np.allclose(benzene.get_msd(), msd_ref)
+    assert np.allclose(benzene.get_msd(reference=2)[:3], [4, 1, 0])
+    benzene_soa = Trajectory(read=benzene_traj_x, layout='soa')
+    assert np.allclose(benzene_soa.get_msd(), msd_ref)
+
+
+def test_msd_kernel_matches_numpy():
+    """Tests single pass mean squared displacement kernel against NumPy calculation."""
+    from angstrom.trajectory.msd import _msd_kernel
+    msd_kernel = getattr(_msd_kernel, 'py_func', _msd_kernel)  # Python function if compiled with Numba
+    np.random.seed(0)
+    coordinates = np.random.rand(20, 36)
+    for reference in [0, 7]:
+        msd_ref = np.square(coordinates - coordinates[reference]).sum(axis=1)
+        assert np.allclose(msd_kernel(coordinates, reference), msd_ref)
+
+
+def test_trajectory_msd_empty_trajectory():
+    """Tests mean squared displacement of an empty trajectory"""
+    assert len(Trajectory().get_msd()) == 0
+    assert len(Trajectory(layout='soa').get_msd()) == 0
+
+
+def test_compiled_msd_kernel_matches_numpy():
+    """Tests Numba compiled (parallel) mean squared displacement kernel against NumPy calculation."""
+    pytest.importorskip('numba')
+    from angstrom.trajectory.msd import _msd_kernel
+    np.random.seed(0)
+    coordinates = np.random.rand(20, 36)
+    for reference in [0, 7]:
+        msd_ref = np.square(coordinates - coordinates[reference]).sum(axis=1)
+        assert np.allclose(_msd_kernel(coordinates, reference), msd_ref)
+    coordinates = np.random.rand(20, 3, 12).astype(np.float32)
+    assert np.allclose(get_msd(coordinates), np.square(coordinates - coordinates[0]).sum(axis=(1, 2)) / 12)